@@ -41,15 +41,16 @@ This module requires Python 2.3 or later.
 from __future__ import generators
 
 import codecs
+import concurrent.futures
 import contextlib
 import errno
 import fnmatch
 import glob
 import hashlib
 import os
-import platform
 import re
 import shutil
+import stat
 import subprocess
 import sys
 import warnings
@@ -65,8 +66,13 @@ del get_versions
 
 __all__ = ['path']
 
+# Decided once at import; sys.platform is a constant, unlike
+# platform.system() which may probe the system on first use.
+_IS_WINDOWS = sys.platform.startswith('win')
+_IS_MACOS = sys.platform == 'darwin'
+
 # Platform-specific support for path.owner
-if os.name == 'nt':
+if _IS_WINDOWS:
     try:
         import win32security
     except ImportError:
@@ -107,7 +113,6 @@ _textmode = 'U'
 if hasattr(__builtins__, 'file') and not hasattr(file, 'newlines'):
     _textmode = 'r'
 
-
 def open_path(path_):
     '''
     Open file/directory using default application.
@@ -116,9 +121,9 @@ def open_path(path_):
 
     [1]: http://stackoverflow.com/questions/6631299/python-opening-a-folder-in-explorer-nautilus-mac-thingie#16204023
     '''
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         os.startfile(path_)
-    elif platform.system() == "Darwin":
+    elif _IS_MACOS:
         subprocess.Popen(["open", path_])
     else:
         subprocess.Popen(["xdg-open", path_])
@@ -127,6 +132,95 @@ def open_path(path_):
 class TreeWalkWarning(Warning):
     pass
 
+
+# Whether filename matching on this platform distinguishes case.
+_CASE_SENSITIVE_FS = os.path.normcase('Aa') == 'Aa'
+
+# One-shot name matcher: when normcase is a no-op, fnmatchcase skips the
+# two per-call case normalizations that fnmatch.fnmatch always performs.
+_fnmatch_name = fnmatch.fnmatchcase if _CASE_SENSITIVE_FS else fnmatch.fnmatch
+
+def _parse_copy_name(name):
+    '''
+    Split a '<base> (Copy <i>)<ext>' file name for :meth:`path.noconflict`.
+
+    Returns
+    -------
+    (str, int or None, str)
+        ``(base, copy_count, ext)``, where `copy_count` is None when no
+        ``' (Copy ...)'`` suffix is present, 0 for a bare ``' (Copy)'``,
+        and the parsed number otherwise.
+
+    A few ``endswith``/``rfind`` calls replace the regex previously used
+    here, so the hot loop in ``noconflict()`` allocates no match object
+    or group dict per iteration.
+    '''
+    dot = name.rfind('.')
+    if dot >= 0:
+        base, ext = name[:dot], name[dot:]
+    else:
+        base, ext = name, ''
+    copy_count = None
+    if base.endswith(' (Copy)'):
+        base = base[:-len(' (Copy)')]
+        copy_count = 0
+    elif base.endswith(')'):
+        start = base.rfind(' (Copy ')
+        if start >= 0:
+            digits = base[start + len(' (Copy '):-1]
+            if digits.isdecimal():
+                copy_count = int(digits)
+                base = base[:start]
+    return base, copy_count, ext
+
+
+def _compile_pattern(pattern):
+    '''
+    Compile an fnmatch-style `pattern` into a `match` callable, applying
+    the same case normalization as :func:`fnmatch.fnmatch`.
+
+    Compiling once per walk avoids a translate/regex-cache lookup per
+    visited name.
+    '''
+    if _CASE_SENSITIVE_FS:
+        return re.compile(fnmatch.translate(pattern)).match
+    matcher = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+    return lambda name: matcher(os.path.normcase(name))
+
+
+def _compile_ignore(ignore):
+    '''
+    Normalize the `ignore` argument of :meth:`path.walkdirs` /
+    :meth:`path.walkfiles` into a compiled `search` callable (or None).
+
+    Accepts a single pattern, an iterable of patterns, or patterns that
+    are already compiled regular expression objects.  The normalization
+    happens exactly once per walk -- a lone string is treated as one
+    pattern, never iterated character by character -- and string
+    patterns are combined into a single alternation regex so each
+    visited path is tested with one match instead of one `re.search`
+    per pattern.
+    '''
+    if ignore is None:
+        return None
+    if isinstance(ignore, str) or hasattr(ignore, 'search'):
+        patterns = (ignore,)
+    else:
+        patterns = tuple(ignore)
+    if not patterns:
+        return None
+    searches = [p.search for p in patterns if hasattr(p, 'search')]
+    strings = [p for p in patterns if not hasattr(p, 'search')]
+    if strings:
+        searches.append(
+            re.compile('|'.join('(?:%s)' % p for p in strings)).search)
+    if len(searches) == 1:
+        return searches[0]
+
+    def search(x, _searches=tuple(searches)):
+        return any(s(x) for s in _searches)
+    return search
+
 class path(_base):
     """ Represents a filesystem path.
 
@@ -374,10 +468,11 @@ class path(_base):
         With the optional 'pattern' argument, this only lists
         items whose names match the given pattern.
         """
-        names = os.listdir(self)
-        if pattern is not None:
-            names = fnmatch.filter(names, pattern)
-        return [self / child for child in names]
+        cls = self.__class__
+        if pattern is None:
+            return [cls(entry.path) for entry in os.scandir(self)]
+        return [cls(entry.path) for entry in os.scandir(self)
+                if _fnmatch_name(entry.name, pattern)]
 
     def dirs(self, pattern=None):
         """ D.dirs() -> List of this directory's subdirectories.
@@ -390,7 +485,14 @@ class path(_base):
         directories whose names match the given pattern.  For
         example, d.dirs('build-*').
         """
-        return [p for p in self.listdir(pattern) if p.isdir()]
+        # One scandir pass: the type check comes from the cached DirEntry
+        # instead of a fresh stat() on every listdir() result.
+        cls = self.__class__
+        if pattern is None:
+            return [cls(entry.path) for entry in os.scandir(self)
+                    if entry.is_dir()]
+        return [cls(entry.path) for entry in os.scandir(self)
+                if entry.is_dir() and _fnmatch_name(entry.name, pattern)]
 
     def files(self, pattern=None):
         """ D.files() -> List of the files in this directory.
@@ -402,8 +504,38 @@ class path(_base):
         whose names match the given pattern.  For example,
         d.files('*.pyc').
         """
+        cls = self.__class__
+        if pattern is None:
+            return [cls(entry.path) for entry in os.scandir(self)
+                    if entry.is_file()]
+        return [cls(entry.path) for entry in os.scandir(self)
+                if entry.is_file() and _fnmatch_name(entry.name, pattern)]
+
+    def _scandir(self, errors='strict'):
+        """ Yield os.DirEntry objects for this directory, lazily.
+
+        Entries stream straight from os.scandir() without being
+        collected into an intermediate list, so the first result is
+        available after a single directory read.  The errors= keyword
+        argument is handled as in path.walk().
+        """
+        try:
+            entries = os.scandir(self)
+        except Exception:
+            if errors == 'ignore':
+                return
+            elif errors == 'warn':
+                warnings.warn(
+                    "Unable to list directory '%s': %s"
+                    % (self, sys.exc_info()[1]),
+                    TreeWalkWarning)
+                return
+            else:
+                raise
 
-        return [p for p in self.listdir(pattern) if p.isfile()]
+        with entries:
+            for entry in entries:
+                yield entry
 
     def walk(self, pattern=None, errors='strict'):
         """ D.walk() -> iterator over files and subdirs, recursively.
@@ -414,6 +546,8 @@ class path(_base):
 
         This performs a depth-first traversal of the directory tree.
         Each directory is returned just before all its children.
+        Results stream as directories are read, so the full tree is
+        never held in memory at once.
 
         The errors= keyword argument controls behavior when an
         error occurs.  The default is 'strict', which causes an
@@ -423,40 +557,39 @@ class path(_base):
         if errors not in ('strict', 'warn', 'ignore'):
             raise ValueError("invalid errors parameter")
 
-        try:
-            childList = self.listdir()
-        except Exception:
-            if errors == 'ignore':
-                return
-            elif errors == 'warn':
-                warnings.warn(
-                    "Unable to list directory '%s': %s"
-                    % (self, sys.exc_info()[1]),
-                    TreeWalkWarning)
-                return
-            else:
-                raise
-
-        for child in childList:
-            if pattern is None or child.fnmatch(pattern):
-                yield child
-            try:
-                isdir = child.isdir()
-            except Exception:
-                if errors == 'ignore':
-                    isdir = False
-                elif errors == 'warn':
-                    warnings.warn(
-                        "Unable to access '%s': %s"
-                        % (child, sys.exc_info()[1]),
-                        TreeWalkWarning)
-                    isdir = False
-                else:
-                    raise
+        name_match = None if pattern is None else _compile_pattern(pattern)
+        return self._walk(name_match, errors)
+
+    def _walk(self, name_match, errors):
+        # Depth-first traversal driven by an explicit stack of open
+        # scandir iterators: no Python frame (or recursion limit) per
+        # directory level, same yield order as the recursive version.
+        stack = [self._scandir(errors)]
+        while stack:
+            for entry in stack[-1]:
+                if name_match is None or name_match(entry.name):
+                    yield self.__class__(entry.path)
+                try:
+                    # The type information is cached on the DirEntry, so
+                    # no extra stat() call is needed for most entries.
+                    isdir = entry.is_dir()
+                except Exception:
+                    if errors == 'ignore':
+                        isdir = False
+                    elif errors == 'warn':
+                        warnings.warn(
+                            "Unable to access '%s': %s"
+                            % (entry.path, sys.exc_info()[1]),
+                            TreeWalkWarning)
+                        isdir = False
+                    else:
+                        raise
 
-            if isdir:
-                for item in child.walk(pattern, errors):
-                    yield item
+                if isdir:
+                    stack.append(self.__class__(entry.path)._scandir(errors))
+                    break
+            else:
+                stack.pop()
 
     def walkdirs(self, pattern=None, errors='strict', ignore=None):
         """ D.walkdirs() -> iterator over subdirs, recursively.
@@ -479,40 +612,45 @@ class path(_base):
         if errors not in ('strict', 'warn', 'ignore'):
             raise ValueError("invalid errors parameter")
 
-        def ignore_match(x):
-            if ignore is not None:
-                if not isinstance(ignore, str):
-                    ignore_list = ignore
-                else:
-                    ignore_list = [ignore]
-                for ip in ignore_list:
-                    if re.search(ip, x):
-                        return True
-            return False
+        name_match = None if pattern is None else _compile_pattern(pattern)
+        return self._walkdirs(name_match, errors, _compile_ignore(ignore))
 
-        if ignore_match(self):
+    def _walkdirs(self, name_match, errors, ignore_search):
+        if ignore_search is not None and ignore_search(self):
             return
 
-        try:
-            dirs = self.dirs()
-        except Exception:
-            if errors == 'ignore':
-                return
-            elif errors == 'warn':
-                warnings.warn(
-                    "Unable to list directory '%s': %s"
-                    % (self, sys.exc_info()[1]),
-                    TreeWalkWarning)
-                return
-            else:
-                raise
+        stack = [self._scandir(errors)]
+        while stack:
+            for entry in stack[-1]:
+                try:
+                    isdir = entry.is_dir()
+                except Exception:
+                    if errors == 'ignore':
+                        isdir = False
+                    elif errors == 'warn':
+                        warnings.warn(
+                            "Unable to access '%s': %s"
+                            % (entry.path, sys.exc_info()[1]),
+                            TreeWalkWarning)
+                        isdir = False
+                    else:
+                        raise
 
-        for child in dirs:
-            if pattern is None or child.fnmatch(pattern):
-                if not ignore_match(child):
+                if not isdir:
+                    continue
+                # entry.path is already a plain string, so the ignore
+                # check needs no path object at all.
+                if ignore_search is not None and ignore_search(entry.path):
+                    # Prune the whole subtree, as the recursive version
+                    # did on entering an ignored directory.
+                    continue
+                child = self.__class__(entry.path)
+                if name_match is None or name_match(entry.name):
                     yield child
-            for subsubdir in child.walkdirs(pattern, errors, ignore):
-                yield subsubdir
+                stack.append(child._scandir(errors))
+                break
+            else:
+                stack.pop()
 
     def walkfiles(self, pattern=None, errors='strict', ignore=None):
         """ D.walkfiles() -> iterator over files in D, recursively.
@@ -526,61 +664,53 @@ class path(_base):
         is specified using one or more regular expression patterns.  If ignore
         is iterable, each pattern will be iterated through.  Otherwise, ignore
         is assumed to be a single string regular expression pattern.
+
+        Whether an entry is a file or a directory is decided from the
+        directory entry observed when its parent was read (as with
+        os.walk), avoiding extra stat() calls; entries that change type
+        mid-walk reflect the type seen at that point.
         """
         if errors not in ('strict', 'warn', 'ignore'):
             raise ValueError("invalid errors parameter")
 
-        def ignore_match(x):
-            if ignore is not None:
-                if not isinstance(ignore, str):
-                    ignore_list = ignore
-                else:
-                    ignore_list = [ignore]
-                for ip in ignore_list:
-                    if re.search(ip, x):
-                        return True
-            return False
+        name_match = None if pattern is None else _compile_pattern(pattern)
+        return self._walkfiles(name_match, errors, _compile_ignore(ignore))
 
-        if ignore_match(self):
+    def _walkfiles(self, name_match, errors, ignore_search):
+        if ignore_search is not None and ignore_search(self):
             return
 
-        try:
-            childList = self.listdir()
-        except Exception:
-            if errors == 'ignore':
-                return
-            elif errors == 'warn':
-                warnings.warn(
-                    "Unable to list directory '%s': %s"
-                    % (self, sys.exc_info()[1]),
-                    TreeWalkWarning)
-                return
+        stack = [self._scandir(errors)]
+        while stack:
+            for entry in stack[-1]:
+                try:
+                    isfile = entry.is_file()
+                    isdir = not isfile and entry.is_dir()
+                except Exception:
+                    if errors == 'ignore':
+                        continue
+                    elif errors == 'warn':
+                        warnings.warn(
+                            "Unable to access '%s': %s"
+                            % (entry.path, sys.exc_info()[1]),
+                            TreeWalkWarning)
+                        continue
+                    else:
+                        raise
+
+                if isfile:
+                    if name_match is not None and not name_match(entry.name):
+                        continue
+                    if ignore_search is not None and ignore_search(entry.path):
+                        continue
+                    yield self.__class__(entry.path)
+                elif isdir:
+                    if ignore_search is not None and ignore_search(entry.path):
+                        continue
+                    stack.append(self.__class__(entry.path)._scandir(errors))
+                    break
             else:
-                raise
-
-        for child in childList:
-            try:
-                isfile = child.isfile()
-                isdir = not isfile and child.isdir()
-            except:
-                if errors == 'ignore':
-                    continue
-                elif errors == 'warn':
-                    warnings.warn(
-                        "Unable to access '%s': %s"
-                        % (self, sys.exc_info()[1]),
-                        TreeWalkWarning)
-                    continue
-                else:
-                    raise
-
-            if isfile:
-                if pattern is None or child.fnmatch(pattern):
-                    if not ignore_match(child):
-                        yield child
-            elif isdir:
-                for f in child.walkfiles(pattern, errors, ignore):
-                    yield f
+                stack.pop()
 
     def fnmatch(self, pattern):
         """ Return True if self.name matches the given pattern.
@@ -588,7 +718,7 @@ class path(_base):
         pattern - A filename pattern with wildcards,
             for example '*.py'.
         """
-        return fnmatch.fnmatch(self.name, pattern)
+        return _fnmatch_name(self.name, pattern)
 
     def glob(self, pattern):
         """ Return a list of path objects that match the pattern.
@@ -610,7 +740,10 @@ class path(_base):
 
     def bytes(self):
         """ Open this file, read all bytes, return them as a string. """
-        f = self.open('rb')
+        # Open unbuffered: FileIO.readall() sizes its buffer from fstat()
+        # and pulls the file in with as few reads as possible, instead of
+        # going through the default 8 KiB buffered reader.
+        f = open(self, 'rb', buffering=0)
         try:
             return f.read()
         finally:
@@ -631,6 +764,7 @@ class path(_base):
             f.write(bytes)
         finally:
             f.close()
+        self._cached_stat = None
 
     def text(self, encoding=None, errors='strict'):
         r""" Open this file, read it in, return the content as a string.
@@ -736,7 +870,8 @@ class path(_base):
         if isinstance(text, unicode):
             if linesep is not None:
                 # Convert all standard end-of-line sequences to
-                # ordinary newline characters.
+                # ordinary newline characters.  Chained replace() runs
+                # in C per sequence and beats a single regex pass here.
                 text = (text.replace(u'\r\n', u'\n')
                             .replace(u'\r\x85', u'\n')
                             .replace(u'\r', u'\n')
@@ -752,9 +887,13 @@ class path(_base):
             assert encoding is None
 
             if linesep is not None:
-                text = (text.replace('\r\n', '\n')
-                            .replace('\r', '\n'))
-                bytes = text.replace('\n', linesep)
+                if isinstance(linesep, unicode):
+                    linesep = linesep.encode('ascii')
+                text = (text.replace(b'\r\n', b'\n')
+                            .replace(b'\r', b'\n'))
+                bytes = text.replace(b'\n', linesep)
+            else:
+                bytes = text
 
         self.write_bytes(bytes, append)
 
@@ -762,9 +901,12 @@ class path(_base):
         file = self.open('wb')
         pickle.dump(obj, file, *args, **kwargs)
         file.close()
+        self._cached_stat = None
 
     def pickle_load(self, *args, **kwargs):
-        file = self.open('rb')
+        # A large userland buffer amortizes the many small reads pickle
+        # issues while decoding opcodes (one kernel read per MiB).
+        file = open(self, 'rb', buffering=1 << 20)
         obj = pickle.load(file, *args, **kwargs)
         file.close()
         return obj
@@ -833,32 +975,40 @@ class path(_base):
             mode = 'ab'
         else:
             mode = 'wb'
+        chunks = []
+        for line in lines:
+            isUnicode = isinstance(line, unicode)
+            if linesep is not None:
+                # Strip off any existing line-end and add the
+                # specified linesep string.
+                if isUnicode:
+                    if line[-2:] in (u'\r\n', u'\x0d\x85'):
+                        line = line[:-2]
+                    elif line[-1:] in (u'\r', u'\n',
+                                       u'\x85', u'\u2028'):
+                        line = line[:-1]
+                    line += linesep
+                else:
+                    if line[-2:] == b'\r\n':
+                        line = line[:-2]
+                    elif line[-1:] in (b'\r', b'\n'):
+                        line = line[:-1]
+                    if isinstance(linesep, unicode):
+                        line += linesep.encode('ascii')
+                    else:
+                        line += linesep
+            if isUnicode:
+                if encoding is None:
+                    encoding = sys.getdefaultencoding()
+                line = line.encode(encoding, errors)
+            chunks.append(line)
+        # A single join + write replaces one buffered write per line.
         f = self.open(mode)
         try:
-            for line in lines:
-                isUnicode = isinstance(line, unicode)
-                if linesep is not None:
-                    # Strip off any existing line-end and add the
-                    # specified linesep string.
-                    if isUnicode:
-                        if line[-2:] in (u'\r\n', u'\x0d\x85'):
-                            line = line[:-2]
-                        elif line[-1:] in (u'\r', u'\n',
-                                           u'\x85', u'\u2028'):
-                            line = line[:-1]
-                    else:
-                        if line[-2:] == '\r\n':
-                            line = line[:-2]
-                        elif line[-1:] in ('\r', '\n'):
-                            line = line[:-1]
-                    line += linesep
-                if isUnicode:
-                    if encoding is None:
-                        encoding = sys.getdefaultencoding()
-                    line = line.encode(encoding, errors)
-                f.write(line)
+            f.write(b''.join(chunks))
         finally:
             f.close()
+        self._cached_stat = None
 
     def read_md5(self):
         """ Calculate the md5 hash for this file.
@@ -870,9 +1020,15 @@ class path(_base):
     def _hash(self, hash_name):
         f = self.open('rb')
         try:
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: the read/update loop runs in C and the GIL
+                # is released around each update.
+                return hashlib.file_digest(f, hash_name)
             m = hashlib.new(hash_name)
             while True:
-                d = f.read(8192)
+                # Read in large chunks so each update() call amortizes the
+                # Python-level overhead over ~1 MiB of hashed data.
+                d = f.read(1 << 20)
                 if not d:
                     break
                 m.update(d)
@@ -901,33 +1057,97 @@ class path(_base):
     # (e.g. isdir on Windows, Python 3.2.2), and compiled functions don't get
     # bound. Playing it safe and wrapping them all in method calls.
 
+    # A stat() snapshot taken by stat_refresh().  When set, isdir(),
+    # isfile() and the size/time accessors answer from it instead of
+    # each issuing a fresh syscall; the modifying methods implemented
+    # on this class clear it (the methods bound straight from shutil,
+    # e.g. copy/copytree/move, cannot and do not).
+    _cached_stat = None
+
+    def stat_refresh(self):
+        """ Cache the result of os.stat() on this path.
+
+        Until the cache is cleared again -- by a modifying method on
+        this object, or by calling stat_refresh() once more -- isdir(),
+        isfile(), getsize(), getatime(), getmtime() and getctime()
+        answer from the snapshot, so a run of queries costs one syscall
+        instead of one each.  Returns the os.stat_result.
+
+        The methods that invalidate the snapshot are the mutators
+        defined on this class: the write_*/pickle_dump family, touch(),
+        utime(), chmod(), chown(), rename()/renames(), mkdir()/
+        makedirs(), rmdir()/removedirs() and remove()/unlink().  The
+        methods bound directly from shutil (copy(), copytree(), move()
+        and friends) bypass the cache and leave it stale; call
+        stat_refresh() again after using them, and never share a
+        snapshot across processes that may touch the file.
+        """
+        self._cached_stat = os.stat(self)
+        return self._cached_stat
+
     def isabs(self): return os.path.isabs(self)
     def exists(self): return os.path.exists(self)
-    def isdir(self): return os.path.isdir(self)
-    def isfile(self): return os.path.isfile(self)
+
+    def isdir(self):
+        st = self._cached_stat
+        return os.path.isdir(self) if st is None else stat.S_ISDIR(st.st_mode)
+
+    def isfile(self):
+        st = self._cached_stat
+        return os.path.isfile(self) if st is None else stat.S_ISREG(st.st_mode)
+
     def islink(self): return os.path.islink(self)
     def ismount(self): return os.path.ismount(self)
 
+    def stat_kind(self):
+        """ Classify this path with a single lstat() call.
+
+        Returns one of 'file', 'dir', 'symlink', 'other' or 'missing'.
+        Cheaper than calling several of the is*() predicates in
+        sequence, each of which performs its own stat() syscall.  Note
+        that, unlike isdir()/isfile(), symbolic links are not followed:
+        a link to a directory is reported as 'symlink'.
+        """
+        try:
+            mode = self.lstat().st_mode
+        except OSError:
+            return 'missing'
+        if stat.S_ISREG(mode):
+            return 'file'
+        if stat.S_ISDIR(mode):
+            return 'dir'
+        if stat.S_ISLNK(mode):
+            return 'symlink'
+        return 'other'
+
     if hasattr(os.path, 'samefile'):
         def samefile(self): return os.path.samefile(self)
 
-    def getatime(self): return os.path.getatime(self)
+    def getatime(self):
+        st = self._cached_stat
+        return os.path.getatime(self) if st is None else st.st_atime
     atime = property(
         getatime, None, None,
         """ Last access time of the file. """)
 
-    def getmtime(self): return os.path.getmtime(self)
+    def getmtime(self):
+        st = self._cached_stat
+        return os.path.getmtime(self) if st is None else st.st_mtime
     mtime = property(
         getmtime, None, None,
         """ Last-modified time of the file. """)
 
     if hasattr(os.path, 'getctime'):
-        def getctime(self): return os.path.getctime(self)
+        def getctime(self):
+            st = self._cached_stat
+            return os.path.getctime(self) if st is None else st.st_ctime
         ctime = property(
             getctime, None, None,
             """ Creation time of the file. """)
 
-    def getsize(self): return os.path.getsize(self)
+    def getsize(self):
+        st = self._cached_stat
+        return os.path.getsize(self) if st is None else st.st_size
     size = property(
         getsize, None, None,
         """ Size of the file, in bytes. """)
@@ -956,7 +1176,7 @@ class path(_base):
         On Windows, this returns a name of the form ur'DOMAIN\User Name'.
         On Windows, a group can own a file or directory.
         """
-        if os.name == 'nt':
+        if _IS_WINDOWS:
             if win32security is None:
                 raise Exception("path.owner requires win32all to be installed")
             desc = win32security.GetFileSecurity(
@@ -989,25 +1209,31 @@ class path(_base):
     def utime(self, times):
         """ Set the access and modified times of this file. """
         os.utime(self, times)
+        self._cached_stat = None
 
     def chmod(self, mode):
         os.chmod(self, mode)
+        self._cached_stat = None
 
     if hasattr(os, 'chown'):
         def chown(self, uid, gid):
             os.chown(self, uid, gid)
+            self._cached_stat = None
 
     def rename(self, new):
         os.rename(self, new)
+        self._cached_stat = None
 
     def renames(self, new):
         os.renames(self, new)
+        self._cached_stat = None
 
 
     # --- Create/delete operations on directories
 
     def mkdir(self, mode=0o777):
         os.mkdir(self, mode)
+        self._cached_stat = None
 
     def mkdir_p(self, mode=0o777):
         try:
@@ -1018,6 +1244,7 @@ class path(_base):
 
     def makedirs(self, mode=0o777):
         os.makedirs(self, mode)
+        self._cached_stat = None
 
     def makedirs_p(self, mode=0o777):
         try:
@@ -1028,6 +1255,7 @@ class path(_base):
 
     def rmdir(self):
         os.rmdir(self)
+        self._cached_stat = None
 
     def rmdir_p(self):
         try:
@@ -1038,6 +1266,7 @@ class path(_base):
 
     def removedirs(self):
         os.removedirs(self)
+        self._cached_stat = None
 
     def removedirs_p(self):
         try:
@@ -1055,9 +1284,11 @@ class path(_base):
         fd = os.open(self, os.O_WRONLY | os.O_CREAT, 0o666)
         os.close(fd)
         os.utime(self, None)
+        self._cached_stat = None
 
     def remove(self):
         os.remove(self)
+        self._cached_stat = None
 
     def remove_p(self):
         try:
@@ -1068,6 +1299,7 @@ class path(_base):
 
     def unlink(self):
         os.unlink(self)
+        self._cached_stat = None
 
     def unlink_p(self):
         self.remove_p()
@@ -1105,55 +1337,90 @@ class path(_base):
         >>> path = path_helpers.path('foo.txt').noconflict()
         >>> path
         path(u'foo (Copy 1).txt')
+
+        Notes
+        -----
+        When many copies already exist, the free name is located with
+        O(log n) existence checks (exponential probing of the copy
+        counter followed by bisection) instead of one check per
+        existing copy.
         '''
-        cre_copy = re.compile(r'^(?P<name>.*?)'
-                              r'(?P<copy> \(Copy(?P<copy_count> \d+)?\))?'
-                              r'(?P<ext>\.[^.]*)?$')
-        candidate_path = self
-
-        while candidate_path.exists():
-            groups_i = cre_copy.match(candidate_path.name).groupdict()
-            if groups_i['copy']:
-                groups_i['copy_count'] = (0 if groups_i['copy_count'] is None
-                                          else int(groups_i['copy_count']))
-                groups_i['copy_count'] += 1
-            candidate_name_i = ('{name} (Copy{}){}'
-                                .format(' {}'.format(groups_i['copy_count'])
-                                        if groups_i['copy_count'] else '',
-                                        groups_i['ext'] or '', **groups_i))
-            candidate_path = candidate_path.parent.joinpath(candidate_name_i)
-        return candidate_path
+        if not self.exists():
+            return self
+
+        parent = self.parent
+        base, copy_count, ext = _parse_copy_name(self.name)
+        # Candidates stay plain name strings throughout; a path object
+        # is only constructed once, for the returned result.
+        prefix = os.path.join(parent, '') if parent else ''
+
+        try:
+            # A single directory read replaces one stat() per candidate;
+            # each probe below is then an in-memory set lookup.
+            existing = set(entry.name
+                           for entry in os.scandir(parent or os.curdir))
+            taken = existing.__contains__
+        except OSError:
+            # Unreadable parent: fall back to per-candidate checks.
+            def taken(name):
+                return os.path.exists(prefix + name)
+
+        def candidate(count):
+            # Counter 0 maps to the bare ' (Copy)' suffix, keeping the
+            # historical naming sequence.
+            if count == 0:
+                return '%s (Copy)%s' % (base, ext)
+            return '%s (Copy %d)%s' % (base, count, ext)
+
+        lo = 0 if copy_count is None else copy_count + 1
+        name = candidate(lo)
+        if not taken(name):
+            return self.__class__(prefix + name)
+        # Exponentially growing steps until a free counter is found ...
+        step = 1
+        while True:
+            hi = lo + step
+            if not taken(candidate(hi)):
+                break
+            lo = hi
+            step *= 2
+        # ... then bisect (lo, hi] for the boundary: lo always exists,
+        # hi is always free.
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if taken(candidate(mid)):
+                lo = mid
+            else:
+                hi = mid
+        return self.__class__(prefix + candidate(hi))
 
     # --- Links
 
-    if hasattr(os, 'link'):
-        def link(self, newpath):
-            """ Create a hard link at 'newpath', pointing to this file. """
-            os.link(self, newpath)
+    def link(self, newpath):
+        """ Create a hard link at 'newpath', pointing to this file. """
+        os.link(self, newpath)
 
-    if hasattr(os, 'symlink'):
-        def symlink(self, newlink):
-            """ Create a symbolic link at 'newlink', pointing here. """
-            os.symlink(self, newlink)
+    def symlink(self, newlink):
+        """ Create a symbolic link at 'newlink', pointing here. """
+        os.symlink(self, newlink)
 
-    if hasattr(os, 'readlink'):
-        def readlink(self):
-            """ Return the path to which this symbolic link points.
+    def readlink(self):
+        """ Return the path to which this symbolic link points.
 
-            The result may be an absolute or a relative path.
-            """
-            return self.__class__(os.readlink(self))
+        The result may be an absolute or a relative path.
+        """
+        return self.__class__(os.readlink(self))
 
-        def readlinkabs(self):
-            """ Return the path to which this symbolic link points.
+    def readlinkabs(self):
+        """ Return the path to which this symbolic link points.
 
-            The result is always an absolute path.
-            """
-            p = self.readlink()
-            if p.isabs():
-                return p
-            else:
-                return (self.parent / p).abspath()
+        The result is always an absolute path.
+        """
+        p = self.readlink()
+        if p.isabs():
+            return p
+        else:
+            return (self.parent / p).abspath()
 
 
     # --- High-level functions from shutil
@@ -1180,15 +1447,21 @@ class path(_base):
 
     # --- Special stuff for Windows
 
-    if platform.system() == 'Windows':
+    if _IS_WINDOWS:
         # Junction methods
         isjunction = ntfsutils.junction.isjunction
         junction = ntfsutils.junction.create
         __unlink = unlink
 
         def unlink(self):
-            if self.isjunction():
+            # One lstat() decides whether this can be a junction at
+            # all; the DeviceIoControl probe in isjunction() then only
+            # runs for reparse points, not for every plain file.
+            st = os.lstat(self)
+            if (st.st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT
+                    and self.isjunction()):
                 ntfsutils.junction.unlink(self)
+                self._cached_stat = None
             else:
                 self.__unlink()
 
@@ -1200,6 +1473,98 @@ class path(_base):
         samefile = ntfsutils.hardlink.samefile
 
 
+def read_hashes(paths, hash_name='sha256', workers=None):
+    '''
+    Calculate the given hash for several files concurrently.
+
+    hashlib releases the GIL while digesting each chunk, so a thread
+    pool scales this otherwise single-core, compute-bound workload
+    across processors.
+
+    Parameters
+    ----------
+    paths : iterable
+        File system paths of the files to hash.
+    hash_name : str
+        Name of the hash, as accepted by :func:`hashlib.new`.
+    workers : int, optional
+        Number of worker threads (default: ``os.cpu_count()``).
+
+    Returns
+    -------
+    list
+        Digest of each file, in the same order as :data:`paths`.
+    '''
+    if workers is None:
+        workers = os.cpu_count()
+    with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        return list(executor.map(lambda p: path(p).read_hash(hash_name),
+                                 paths))
+
+
+def _copy_stream(srcstream, dstname):
+    '''
+    Copy the contents of an open binary stream to the file `dstname`.
+
+    When the stream is backed by a real file descriptor (i.e., the
+    resource lives on disk rather than inside a zip archive), the copy
+    stays in the kernel: ``os.copy_file_range`` where available (an
+    O(1) reflink on copy-on-write file systems), otherwise
+    ``os.sendfile`` in 4 MiB chunks.  Streams without a descriptor fall
+    back to writing the contents out directly.
+    '''
+    try:
+        src_fd = srcstream.fileno()
+    except (AttributeError, OSError):
+        src_fd = None
+    with open(dstname, 'wb') as output:
+        if src_fd is not None:
+            dst_fd = output.fileno()
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while os.copy_file_range(src_fd, dst_fd, 1 << 30):
+                        pass
+                    return
+                except OSError:
+                    # e.g., unsupported file system: retry below.
+                    srcstream.seek(0)
+                    output.seek(0)
+                    output.truncate()
+            if hasattr(os, 'sendfile'):
+                try:
+                    offset = 0
+                    while True:
+                        sent = os.sendfile(dst_fd, src_fd, offset, 1 << 22)
+                        if not sent:
+                            return
+                        offset += sent
+                except OSError:
+                    srcstream.seek(0)
+                    output.seek(0)
+                    output.truncate()
+        output.write(srcstream.read())
+
+
+def _copy_file(srcname, dstname):
+    '''
+    Copy the file `srcname` to the file `dstname`.
+    '''
+    with open(srcname, 'rb') as srcstream:
+        _copy_stream(srcstream, dstname)
+
+
+def _copy_resource(module, srcname, dstname):
+    '''
+    Copy the module resource `srcname` to the file `dstname`.
+    '''
+    from contextlib import closing
+    import pkg_resources
+
+    with closing(pkg_resources.resource_stream(module,
+                                               srcname)) as srcstream:
+        _copy_stream(srcstream, dstname)
+
+
 def resource_copytree(module, src, dst, ignore=None):
     '''
     Port of `shutil.copytree` to support copying from a Python module.
@@ -1210,36 +1575,145 @@ def resource_copytree(module, src, dst, ignore=None):
 
     .. versionadded:: 0.8
     '''
-    from contextlib import closing
     import pkg_resources
 
-    names = pkg_resources.resource_listdir(module, src)
-    if ignore is not None:
-        ignored_names = ignore(module, src, names)
-    else:
-        ignored_names = set()
+    # Bind the hot attribute chains once; inside the loops these are
+    # LOAD_FAST locals instead of module attribute lookups per entry.
+    _resource_listdir = pkg_resources.resource_listdir
+    _resource_isdir = pkg_resources.resource_isdir
+    _makedirs = os.makedirs
+    sep = os.sep
 
-    os.makedirs(dst)
     errors = []
-    for name in names:
-        if name in ignored_names:
-            continue
-        srcname = os.path.join(src, name)
-        dstname = os.path.join(dst, name)
+    futures = []
+    # Iterate with an explicit stack instead of recursing per directory;
+    # deep trees no longer pay a Python call frame (or risk hitting the
+    # recursion limit) per level.  Directories are created in order on
+    # this thread, while file copies are dispatched to a thread pool so
+    # that several copy syscalls can be in flight at once.
+    stack = [(src, dst)]
+    root = True
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    # When the package is an ordinary directory on disk (DefaultProvider,
+    # i.e., not inside a zip or egg), the tree can be driven by os.walk:
+    # one directory read yields names and cached type information
+    # together, with no resource-API dispatch per entry.
+    root_dir = None
+    try:
+        provider = pkg_resources.get_provider(module)
+        if isinstance(provider, pkg_resources.DefaultProvider):
+            root_dir = pkg_resources.resource_filename(module, src)
+            if not os.path.isdir(root_dir):
+                root_dir = None
+    except Exception:
+        root_dir = None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        _submit = executor.submit
+        _push = stack.append
+        _record = errors.append
+        if root_dir is not None:
+            def onerror(why):
+                # Report directory-read failures like the resource
+                # driver below: an unreadable root raises immediately,
+                # anything deeper is recorded and skipped.
+                dirpath = getattr(why, 'filename', None) or root_dir
+                rel = dirpath[len(root_dir):].lstrip(sep)
+                if not rel:
+                    raise why
+                src_rel = (src + sep + rel) if src else rel
+                _record((module, src_rel, dst + sep + rel, str(why)))
+
+            for dirpath, dirnames, filenames in os.walk(root_dir,
+                                                        onerror=onerror):
+                rel = dirpath[len(root_dir):].lstrip(sep)
+                if rel:
+                    src_rel = (src + sep + rel) if src else rel
+                    dst_dir = dst + sep + rel
+                else:
+                    src_rel = src
+                    dst_dir = dst
+                if ignore is not None:
+                    ignored_names = ignore(module, src_rel,
+                                           dirnames + filenames)
+                    if ignored_names:
+                        dirnames[:] = [name for name in dirnames
+                                       if name not in ignored_names]
+                else:
+                    ignored_names = set()
+                try:
+                    _makedirs(dst_dir)
+                except EnvironmentError as why:
+                    if root:
+                        raise
+                    _record((module, src_rel, dst_dir, str(why)))
+                    # Mirror the resource driver: a directory that
+                    # cannot be created is not descended into.
+                    dirnames[:] = []
+                    continue
+                finally:
+                    root = False
+                src_prefix = dirpath + sep
+                dst_prefix = dst_dir + sep
+                for name in filenames:
+                    if name in ignored_names:
+                        continue
+                    srcname = src_prefix + name
+                    dstname = dst_prefix + name
+                    futures.append((srcname, dstname,
+                                    _submit(_copy_file, srcname,
+                                            dstname)))
+        else:
+            while stack:
+                src_i, dst_i = stack.pop()
+                try:
+                    names = _resource_listdir(module, src_i)
+                    if ignore is not None:
+                        ignored_names = ignore(module, src_i, names)
+                    else:
+                        ignored_names = set()
+                    _makedirs(dst_i)
+                except EnvironmentError as why:
+                    # Failures below the root are recorded so that copying
+                    # can continue with other files; the root keeps the
+                    # original behaviour of raising immediately (e.g.,
+                    # existing ``dst``).
+                    if root:
+                        raise
+                    _record((module, src_i, dst_i, str(why)))
+                    continue
+                finally:
+                    root = False
+                # Join per directory rather than per entry: the separator
+                # logic of os.path.join runs once here, leaving a plain
+                # string concatenation in the loop below.
+                if src_i and not src_i.endswith(sep):
+                    src_prefix = src_i + sep
+                else:
+                    src_prefix = src_i
+                if dst_i and not dst_i.endswith(sep):
+                    dst_prefix = dst_i + sep
+                else:
+                    dst_prefix = dst_i
+                for name in names:
+                    if name in ignored_names:
+                        continue
+                    srcname = src_prefix + name
+                    dstname = dst_prefix + name
+                    try:
+                        if _resource_isdir(module, srcname):
+                            _push((srcname, dstname))
+                        else:
+                            futures.append((srcname, dstname,
+                                            _submit(_copy_resource, module,
+                                                    srcname, dstname)))
+                    except EnvironmentError as why:
+                        _record((module, srcname, dstname, str(why)))
+    for srcname, dstname, future in futures:
         try:
-            if pkg_resources.resource_isdir(module, srcname):
-                resource_copytree(module, srcname, dstname, ignore)
-            else:
-                with closing(pkg_resources
-                             .resource_stream(module, srcname)) as srcstream:
-                    with open(dstname, 'wb') as output:
-                        output.write(srcstream.read())
-
-        # catch the Error from the recursive copytree so that we can
-        # continue with other files
-        except shutil.Error, err:
-            errors.extend(err.args[0])
-        except EnvironmentError, why:
+            future.result()
+        except EnvironmentError as why:
             errors.append((module, srcname, dstname, str(why)))
     if errors:
-        raise shutil.Error, errors
+        raise shutil.Error(errors)